@@ -1,16 +1,23 @@
+import csv
+import hashlib
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Callable
+import numpy as np
 import pandas as pd
 
-from models import BusType, BatteryType, BusConfig
+from models import BusType, BatteryType, BusConfig, BatteryConstraints
 from config import (
     BATTERY_CONSTRAINTS, DEFAULT_BUS_CONFIG, BUDGET_LIMIT_EUR,
-    LOAD_COST_PER_KWH_EUR, DEFAULT_LOAD_MW, DEFAULT_LOAD_MVAR
+    LOAD_COST_PER_KWH_EUR, DEFAULT_LOAD_MW, DEFAULT_LOAD_MVAR, PARSE_CACHE_SIZE
 )
 from parsing import (
     parse_generators, parse_loads, parse_lines, parse_buses,
-    extract_datetimes, extract_branch_name, group_battery_columns_by_bus, group_loads_by_bus
+    extract_datetimes, extract_branch_name, group_battery_columns_by_bus, group_loads_by_bus,
+    PU_VOLT_RE
 )
 from validation import (
     calculate_capacity_timeseries, validate_battery_capacity, check_battery_warnings,
@@ -18,67 +25,127 @@ from validation import (
     detect_reverse_power_flow, calculate_battery_cost
 )
 
+# Branch from bus 1 to bus 2, e.g. "1 (1) TO 2 (2) CKT 1 ..." or "1 TO 2 CKT 1 ..."
+_MAIN_LINE_RE = re.compile(r'^\s*1\s(?:.*\s)?TO\s+2\s', re.IGNORECASE)
+
+_BATTERY_TYPE_BY_BUS_TYPE = {
+    BusType.RESIDENTIAL: BatteryType.HOME,
+    BusType.COMMUNITY: BatteryType.NEIGHBORHOOD,
+}
+
 
 class BusConfigManager:
     def __init__(self):
-        self._configs: Dict[int, BusConfig] = {}
-
-    def _ensure_initialized(self):
-        if not self._configs:
-            self._configs = dict(DEFAULT_BUS_CONFIG)
+        self._configs: Dict[int, BusConfig] = dict(DEFAULT_BUS_CONFIG)
+        # Bus configs are fixed, so each bus's battery type and constraints are resolved once
+        self._battery_constraints: Dict[int, Tuple[Optional[BatteryConstraints], BatteryType]] = {}
+        for bus_num, bus_config in self._configs.items():
+            battery_type = _BATTERY_TYPE_BY_BUS_TYPE.get(bus_config.bus_type)
+            if battery_type:
+                self._battery_constraints[bus_num] = (BATTERY_CONSTRAINTS.get(battery_type), battery_type)
 
     def get(self, bus_num: int) -> Optional[BusConfig]:
-        self._ensure_initialized()
         return self._configs.get(bus_num)
 
+    def get_battery_constraints(self, bus_num: int) -> Optional[Tuple[Optional[BatteryConstraints], BatteryType]]:
+        return self._battery_constraints.get(bus_num)
+
 
 class LoadDataStore:
     def __init__(self):
-        self.default_mw: str = DEFAULT_LOAD_MW  # Original pasted MW data
-        self.default_mvar: str = DEFAULT_LOAD_MVAR  # Original pasted MVar data
+        self._default_mw: str = DEFAULT_LOAD_MW  # Original pasted MW data
+        self._default_mvar: str = DEFAULT_LOAD_MVAR  # Original pasted MVar data
         self.current_mw: str = DEFAULT_LOAD_MW  # Current working MW data
         self.current_mvar: str = DEFAULT_LOAD_MVAR  # Current working MVar data
         self.current_load_cost_eur: float = 0.0
+        # Parsed (DataFrame, load_by_bus) of the defaults, cleared when they are reassigned
+        self._parsed_defaults: Dict[str, Tuple[pd.DataFrame, Dict]] = {}
 
+    @property
+    def default_mw(self) -> str:
+        return self._default_mw
 
-bus_config_manager = BusConfigManager()
-load_store = LoadDataStore()
+    @default_mw.setter
+    def default_mw(self, text: str):
+        self._default_mw = text
+        self._parsed_defaults.pop('mw', None)
+
+    @property
+    def default_mvar(self) -> str:
+        return self._default_mvar
+
+    @default_mvar.setter
+    def default_mvar(self, text: str):
+        self._default_mvar = text
+        self._parsed_defaults.pop('mvar', None)
 
+    def _get_parsed_default(self, key: str, text: str) -> Tuple[pd.DataFrame, Dict]:
+        if key not in self._parsed_defaults:
+            df = parse_loads(text)
+            self._parsed_defaults[key] = (df, group_loads_by_bus(df))
+        return self._parsed_defaults[key]
 
-def get_battery_type_for_bus(bus_type: BusType) -> Optional[BatteryType]:
-    if bus_type == BusType.RESIDENTIAL:
-        return BatteryType.HOME
-    elif bus_type == BusType.COMMUNITY:
-        return BatteryType.NEIGHBORHOOD
-    return None
+    def get_default_mw(self) -> Tuple[pd.DataFrame, Dict]:
+        return self._get_parsed_default('mw', self._default_mw)
 
+    def get_default_mvar(self) -> Tuple[pd.DataFrame, Dict]:
+        return self._get_parsed_default('mvar', self._default_mvar)
 
-def get_battery_constraints_for_bus(bus_num: int):
-    bus_config = bus_config_manager.get(bus_num)
-    if not bus_config:
-        return None
 
-    battery_type = get_battery_type_for_bus(bus_config.bus_type)
-    if not battery_type:
-        return None
+class ParseCache:
+    # Every re-analysis resends all pastes, mostly unchanged. Parsed results are shared
+    # between requests, so callers must treat them as read-only.
+    def __init__(self, maxsize: int = PARSE_CACHE_SIZE):
+        self._maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
 
-    return BATTERY_CONSTRAINTS.get(battery_type), battery_type
+    def get(self, parse: Callable[[str], Any], text: str) -> Any:
+        key = (parse.__name__, hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest())
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        parsed = parse(text)
+
+        with self._lock:
+            self._entries[key] = parsed
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return parsed
+
+
+bus_config_manager = BusConfigManager()
+load_store = LoadDataStore()
+parse_cache = ParseCache()
 
 
 def calculate_battery_capacity_and_costs(
     df: pd.DataFrame,
     battery_by_bus: Dict[int, List[str]]
-) -> Tuple[Dict[str, List[float]], List[Dict], Dict[str, Dict]]:
+) -> Tuple[Dict[str, np.ndarray], List[Dict], Dict[str, Dict]]:
     battery_capacity = {}
     validation_errors = []
     costs = {}
 
-    for bus_num, gen_names in battery_by_bus.items():
-        bus_mw = df[gen_names].sum(axis=1)
-        capacity_kwh = calculate_capacity_timeseries(bus_mw)
-        battery_capacity[str(bus_num)] = capacity_kwh.tolist()
+    if not battery_by_bus:
+        return battery_capacity, validation_errors, costs
+
+    # Sum every bus's battery columns in one reduction over a (timesteps x columns) matrix
+    battery_columns = [col for gen_names in battery_by_bus.values() for col in gen_names]
+    group_starts = np.cumsum([0] + [len(gen_names) for gen_names in battery_by_bus.values()][:-1])
+    battery_mw = df[battery_columns].fillna(0.0).to_numpy(dtype=np.float64)
+    bus_mw_matrix = np.add.reduceat(battery_mw, group_starts, axis=1)
+    capacity_matrix = calculate_capacity_timeseries(bus_mw_matrix)
 
-        result = get_battery_constraints_for_bus(bus_num)
+    for bus_index, bus_num in enumerate(battery_by_bus):
+        bus_str = str(bus_num)
+        bus_mw = bus_mw_matrix[:, bus_index]
+        capacity_kwh = capacity_matrix[:, bus_index]
+        battery_capacity[bus_str] = capacity_kwh
+
+        result = bus_config_manager.get_battery_constraints(bus_num)
         if not result:
             continue
 
@@ -91,8 +158,8 @@ def calculate_battery_capacity_and_costs(
             warnings = check_battery_warnings(bus_num, capacity_kwh, constraints)
             validation_errors.extend(warnings)
 
-        max_capacity = max(capacity_kwh) if len(capacity_kwh) > 0 else 0.0
-        costs[str(bus_num)] = calculate_battery_cost(max_capacity, constraints, battery_type)
+        max_capacity = float(capacity_kwh.max()) if len(capacity_kwh) > 0 else 0.0
+        costs[bus_str] = calculate_battery_cost(max_capacity, constraints, battery_type)
 
     return battery_capacity, validation_errors, costs
 
@@ -112,7 +179,7 @@ def calculate_budget_summary(battery_costs: Dict, load_cost_eur: float = 0.0) ->
 
 
 def analyze_lines(text: str) -> Dict[str, Any]:
-    mva_limit_df, mw_from_df = parse_lines(text)
+    mva_limit_df, mw_from_df = parse_cache.get(parse_lines, text)
     datetimes = extract_datetimes(mva_limit_df)
 
     base_cols = ['Date', 'Time', 'Skip']
@@ -122,43 +189,38 @@ def analyze_lines(text: str) -> Dict[str, Any]:
     if not branch_columns:
         raise ValueError("No branch columns found in data")
 
-    branches = {}
-    for col in branch_columns:
-        branch_name = extract_branch_name(col)
-        branches[branch_name] = mva_limit_df[col].tolist()
+    branch_names = {col: extract_branch_name(col) for col in branch_columns}
+    # parse_lines has already converted these columns to numbers
+    branch_df = mva_limit_df[branch_columns]
+    branches = {branch_name: branch_df[col].to_numpy(dtype=np.float64) for col, branch_name in branch_names.items()}
 
     stats = {}
-    for branch_name, values in branches.items():
-        numeric_values = [float(v) for v in values if pd.notna(v)]
-        if numeric_values:
-            stats[branch_name] = {
-                "max": max(numeric_values),
-                "min": min(numeric_values),
-                "avg": sum(numeric_values) / len(numeric_values),
-                "current": numeric_values[-1] if numeric_values else None
-            }
-
-    main_line_col = None
-    for col in branch_columns:
-        col_normalized = ' '.join(col.upper().split())
-        if (col_normalized.startswith('1 ') and ' TO 2 ' in col_normalized) or \
-           (col_normalized.startswith('1 (1) ') and ' TO 2 (2) ' in col_normalized):
-            main_line_col = col
-            break
+    if not branch_df.empty:
+        summary = branch_df.agg(['min', 'max', 'mean', 'count'])
+        current = branch_df.ffill().iloc[-1]
+        for col, branch_name in branch_names.items():
+            if summary.at['count', col] > 0:
+                stats[branch_name] = {
+                    "max": float(summary.at['max', col]),
+                    "min": float(summary.at['min', col]),
+                    "avg": float(summary.at['mean', col]),
+                    "current": float(current[col])
+                }
+
+    main_line_col = next((col for col in branch_columns if _MAIN_LINE_RE.match(col)), None)
 
     main_line_below_90 = False
     main_line_flatness = None
     main_line_load_factor = None
 
     if main_line_col and main_line_col in mva_limit_df.columns:
-        main_line_values = [float(v) for v in mva_limit_df[main_line_col].tolist() if pd.notna(v)]
-        if main_line_values:
-            main_line_below_90 = all(v < 90 for v in main_line_values)
-            mean = sum(main_line_values) / len(main_line_values)
-            peak = max(main_line_values)
+        main_line_values = mva_limit_df[main_line_col].to_numpy(dtype=np.float64)
+        if main_line_values.size:
+            main_line_below_90 = not (main_line_values >= 90).any()
+            mean = float(main_line_values.mean())
+            peak = float(main_line_values.max())
             if mean > 0:
-                variance = sum((v - mean) ** 2 for v in main_line_values) / len(main_line_values)
-                main_line_flatness = (variance ** 0.5 / mean) * 100
+                main_line_flatness = float(np.sqrt(main_line_values.var()) / mean * 100)
             if peak > 0:
                 main_line_load_factor = mean / peak
 
@@ -170,16 +232,14 @@ def analyze_lines(text: str) -> Dict[str, Any]:
     if mw_from_columns:
         # We have MW From data, check for reverse flow on branch 1-2
         main_transformer_reverse_flow = False
-        for col in mw_from_columns:
-            branch_name = extract_branch_name(col)
-            if branch_name == "1-2":
-                values = mw_from_df[col].tolist()
-                # Check if any value is negative (reverse flow)
-                error = detect_reverse_power_flow(values, branch_name)
-                if error:
-                    reverse_flow_errors.append(error)
-                    main_transformer_reverse_flow = True
-                break
+        main_transformer_col = next((col for col in mw_from_columns if extract_branch_name(col) == "1-2"), None)
+        if main_transformer_col:
+            values = mw_from_df[main_transformer_col].to_numpy(dtype=np.float64)
+            # Check if any value is negative (reverse flow)
+            error = detect_reverse_power_flow(values, "1-2")
+            if error:
+                reverse_flow_errors.append(error)
+                main_transformer_reverse_flow = True
 
     return {
         "data": {"datetime": datetimes, "branches": branches},
@@ -194,7 +254,7 @@ def analyze_lines(text: str) -> Dict[str, Any]:
 
 
 def analyze_buses(text: str) -> Dict[str, Any]:
-    df = parse_buses(text)
+    df = parse_cache.get(parse_buses, text)
 
     if 'Date' not in df.columns or 'Time' not in df.columns:
         raise ValueError("Date and Time columns are required")
@@ -207,25 +267,26 @@ def analyze_buses(text: str) -> Dict[str, Any]:
     buses_dict = {}
     statistics_dict = {}
 
+    # parse_buses has already converted these columns to numbers
+    voltage_df = df[voltage_cols]
+    summary = voltage_df.agg(['min', 'max', 'mean', 'count']) if voltage_cols else pd.DataFrame()
+
     for col in voltage_cols:
-        bus_match = re.match(r'(\d+)\s+PU Volt', col)
+        bus_match = PU_VOLT_RE.match(col)
         if bus_match:
             bus_num = bus_match.group(1)
             bus_numbers.append(bus_num)
+            buses_dict[bus_num] = voltage_df[col].to_numpy()
 
-            values = df[col].tolist()
-            buses_dict[bus_num] = values
-
-            numeric_values = [v for v in values if pd.notna(v)]
-            if numeric_values:
+            if summary.at['count', col] > 0:
                 statistics_dict[bus_num] = {
-                    "min": float(min(numeric_values)),
-                    "max": float(max(numeric_values)),
-                    "avg": float(sum(numeric_values) / len(numeric_values))
+                    "min": float(summary.at['min', col]),
+                    "max": float(summary.at['max', col]),
+                    "avg": float(summary.at['mean', col])
                 }
 
-    voltage_errors = validate_bus_voltages(df)
-    buses_with_violations = len(set(error["bus"] for error in voltage_errors))
+    voltage_errors, violating_buses = validate_bus_voltages(df)
+    buses_with_violations = len(violating_buses)
 
     return {
         "data": {"datetime": datetimes, "buses": buses_dict},
@@ -237,7 +298,7 @@ def analyze_buses(text: str) -> Dict[str, Any]:
 
 
 def analyze_generators(text: str, load_cost_eur: float = 0.0) -> Dict[str, Any]:
-    df = parse_generators(text)
+    df = parse_cache.get(parse_generators, text)
 
     if 'Date' not in df.columns or 'Time' not in df.columns:
         raise ValueError("Date and Time columns are required")
@@ -251,39 +312,44 @@ def analyze_generators(text: str, load_cost_eur: float = 0.0) -> Dict[str, Any]:
             next_day = next_day + timedelta(days=1)
         datetimes.append(next_day.isoformat())
 
-    gen_columns = [col for col in df.columns
-                   if col.lower().startswith('gen') and 'mw' in col.lower()
-                   and 'gen 1 #1' not in col.lower()]
+    gen_columns = []
+    battery_columns = []
+    for col in df.columns:
+        lower = col.lower()
+        if not (lower.startswith('gen') and 'mw' in lower) or 'gen 1 #1' in lower:
+            continue
+        gen_columns.append(col)
+        if '#bt' in lower:
+            battery_columns.append(col)
 
-    battery_columns = [col for col in gen_columns if '#bt' in col.lower()]
     battery_by_bus = group_battery_columns_by_bus(battery_columns)
 
     battery_capacity, validation_errors, costs = calculate_battery_capacity_and_costs(df, battery_by_bus)
 
     battery_table_cols = ['Date', 'Time'] + battery_columns
-    battery_table_df = df[battery_table_cols].copy()
+
+    battery_by_bus_str = {str(k): v for k, v in battery_by_bus.items()}
 
     battery_table_metadata = {}
-    for bus_num, gen_names in battery_by_bus.items():
+    for bus_str, gen_names in battery_by_bus_str.items():
         for gen_name in gen_names:
-            battery_table_metadata[gen_name] = str(bus_num)
+            battery_table_metadata[gen_name] = bus_str
 
-    generators_dict = {col: df[col].tolist() for col in gen_columns}
+    generators_dict = {col: df[col].to_numpy() for col in gen_columns}
 
     budget_summary = calculate_budget_summary(costs, load_cost_eur)
 
     return {
         "columns": df.columns.tolist(),
-        "rows": df.values.tolist(),
         "data": df.to_dict('records'),
         "datetime": datetimes,
         "generators": generators_dict,
         "generator_columns": gen_columns,
         "battery_capacity": battery_capacity,
-        "battery_by_bus": {str(k): v for k, v in battery_by_bus.items()},
+        "battery_by_bus": battery_by_bus_str,
         "battery_table": {
             "columns": battery_table_cols,
-            "data": battery_table_df.to_dict('records'),
+            "data": df[battery_table_cols].to_dict('records'),
             "metadata": battery_table_metadata
         },
         "validation_errors": validation_errors,
@@ -292,7 +358,27 @@ def analyze_generators(text: str, load_cost_eur: float = 0.0) -> Dict[str, Any]:
     }
 
 
-def _parse_load_data(text: Optional[str], col_key: str) -> Tuple[Optional[pd.DataFrame], Dict[str, List[float]], List[str], Dict]:
+def _load_arrays_by_bus(df: pd.DataFrame, load_by_bus: Dict, col_key: str) -> Dict[int, np.ndarray]:
+    data = {}
+    for bus_num, cols in load_by_bus.items():
+        col = cols.get(col_key)
+        if col:
+            data[bus_num] = df[col].to_numpy(dtype=np.float64, copy=False)
+    return data
+
+
+def _energy_moved_kwh(mw_diffs: Dict[str, np.ndarray]) -> Dict[str, float]:
+    if not mw_diffs:
+        return {}
+    # All diffs come from the same paste so they share a length; one reduction over the
+    # stacked (bus, timepoint) matrix instead of one per bus.
+    # MW over 1 hour = MWh, * 1000 = kWh, / 2 because each move is counted
+    # twice (from source and to destination): |diff| * 500
+    moved = np.abs(np.stack(list(mw_diffs.values()))).sum(axis=1) * 500.0
+    return dict(zip(mw_diffs.keys(), moved.tolist()))
+
+
+def _parse_load_data(text: Optional[str], col_key: str) -> Tuple[Optional[pd.DataFrame], Dict[int, np.ndarray], List[str], Dict]:
     if not text or not text.strip():
         return None, {}, [], {}
 
@@ -300,13 +386,7 @@ def _parse_load_data(text: Optional[str], col_key: str) -> Tuple[Optional[pd.Dat
     datetimes = extract_datetimes(df)
     load_by_bus = group_loads_by_bus(df)
 
-    data = {}
-    for bus_num, cols in load_by_bus.items():
-        col = cols.get(col_key)
-        if col:
-            data[str(bus_num)] = df[col].tolist()
-
-    return df, data, datetimes, load_by_bus
+    return df, _load_arrays_by_bus(df, load_by_bus, col_key), datetimes, load_by_bus
 
 
 def analyze_loads(mw_text: Optional[str], mvar_text: Optional[str]) -> Dict[str, Any]:
@@ -340,7 +420,6 @@ def analyze_loads(mw_text: Optional[str], mvar_text: Optional[str]) -> Dict[str,
 
         return {
             "columns": df_to_use.columns.tolist(),
-            "rows": df_to_use.values.tolist(),
             "data": df_to_use.to_dict("records"),
             "datetime": datetimes,
             "load_columns": [col for col in df_to_use.columns if col not in ["Date", "Time"]],
@@ -355,61 +434,48 @@ def analyze_loads(mw_text: Optional[str], mvar_text: Optional[str]) -> Dict[str,
             "is_first_paste": True
         }
 
-    default_mw_df = parse_loads(load_store.default_mw)
-    default_mvar_df = parse_loads(load_store.default_mvar)
-
-    default_mw_load_by_bus = group_loads_by_bus(default_mw_df)
-    default_mvar_load_by_bus = group_loads_by_bus(default_mvar_df)
-
-    default_mw_data: Dict[str, List[float]] = {}
-    default_mvar_data: Dict[str, List[float]] = {}
-
-    for bus_num, cols in default_mw_load_by_bus.items():
-        if cols["mw_col"]:
-            default_mw_data[str(bus_num)] = default_mw_df[cols["mw_col"]].tolist()
+    default_mw_df, default_mw_load_by_bus = load_store.get_default_mw()
+    default_mvar_df, default_mvar_load_by_bus = load_store.get_default_mvar()
 
-    for bus_num, cols in default_mvar_load_by_bus.items():
-        if cols["mvar_col"]:
-            default_mvar_data[str(bus_num)] = default_mvar_df[cols["mvar_col"]].tolist()
+    default_mw_data = _load_arrays_by_bus(default_mw_df, default_mw_load_by_bus, "mw_col")
+    default_mvar_data = _load_arrays_by_bus(default_mvar_df, default_mvar_load_by_bus, "mvar_col")
 
     combined_mw_data = new_mw_data if has_mw else default_mw_data.copy()
     combined_mvar_data = new_mvar_data if has_mvar else default_mvar_data.copy()
 
-    differences: Dict[str, Dict[str, List[float]]] = {}
-    energy_moved_kwh: Dict[str, float] = {}
+    differences: Dict[str, Dict[str, Any]] = {}
+    mw_diffs: Dict[str, np.ndarray] = {}
 
     if has_mw:
-        for bus_str, new_values in new_mw_data.items():
-            if bus_str not in default_mw_data:
+        for bus_num, new_values in new_mw_data.items():
+            if bus_num not in default_mw_data:
                 continue
 
-            default_values = default_mw_data[bus_str]
-            errors = validate_load_energy_conservation(int(bus_str), new_values, default_values, "mw")
+            default_values = default_mw_data[bus_num]
+            errors = validate_load_energy_conservation(bus_num, new_values, default_values, "mw")
             validation_errors.extend(errors)
 
             if not errors:
-                mw_diff = [new_values[i] - default_values[i] for i in range(len(new_values))]
+                bus_str = str(bus_num)
+                mw_diff = new_values - default_values
                 differences.setdefault(bus_str, {"mw": [], "mvar": []})["mw"] = mw_diff
+                if mw_diff.size:
+                    mw_diffs[bus_str] = mw_diff
 
     if has_mvar:
-        for bus_str, new_values in new_mvar_data.items():
-            if bus_str not in default_mvar_data:
+        for bus_num, new_values in new_mvar_data.items():
+            if bus_num not in default_mvar_data:
                 continue
 
-            default_values = default_mvar_data[bus_str]
-            errors = validate_load_energy_conservation(int(bus_str), new_values, default_values, "mvar")
+            default_values = default_mvar_data[bus_num]
+            errors = validate_load_energy_conservation(bus_num, new_values, default_values, "mvar")
             validation_errors.extend(errors)
 
             if not errors:
-                mvar_diff = [new_values[i] - default_values[i] for i in range(len(new_values))]
-                differences.setdefault(bus_str, {"mw": [], "mvar": []})["mvar"] = mvar_diff
-
-    for bus_str, diff in differences.items():
-        if diff.get("mw"):
-            # Convert MW to kWh: MW * 1 hour = MWh, then MWh * 1000 = kWh
-            # Divide by 2 because each move is counted twice (from source and to destination)
-            energy_moved_kwh[bus_str] = sum(abs(d) for d in diff["mw"]) / 2.0 * 1000
+                mvar_diff = new_values - default_values
+                differences.setdefault(str(bus_num), {"mw": [], "mvar": []})["mvar"] = mvar_diff
 
+    energy_moved_kwh = _energy_moved_kwh(mw_diffs)
     total_energy_moved = sum(energy_moved_kwh.values())
     load_cost_eur = total_energy_moved * LOAD_COST_PER_KWH_EUR
     load_store.current_load_cost_eur = load_cost_eur
@@ -418,7 +484,6 @@ def analyze_loads(mw_text: Optional[str], mvar_text: Optional[str]) -> Dict[str,
 
     return {
         "columns": df_to_use.columns.tolist(),
-        "rows": df_to_use.values.tolist(),
         "data": df_to_use.to_dict("records"),
         "datetime": datetimes,
         "load_columns": [col for col in df_to_use.columns if col not in ["Date", "Time"]],
@@ -481,8 +546,18 @@ def analyze_all(
         "budget_summary": None
     }
 
-    if lines_data:
-        result["lines"] = analyze_lines(lines_data)
+    # Lines and buses are independent and read-only, so they run in parallel. They are
+    # collected before loads -> generators (which needs the load cost) so a bad lines or
+    # buses paste fails the request before the load state is replaced.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        lines_future = executor.submit(analyze_lines, lines_data) if lines_data else None
+        buses_future = executor.submit(analyze_buses, buses_data) if buses_data else None
+
+        if lines_future:
+            result["lines"] = lines_future.result()
+
+        if buses_future:
+            result["buses"] = buses_future.result()
 
     load_cost_eur = 0.0
     if loads_mw_data or loads_mvar_data:
@@ -495,9 +570,6 @@ def analyze_all(
         result["generators"] = gen_result
         result["budget_summary"] = gen_result.get("budget_summary")
 
-    if buses_data:
-        result["buses"] = analyze_buses(buses_data)
-
     return result
 
 
@@ -512,52 +584,60 @@ def apply_load_moves(operations: List[Dict[str, Any]]) -> Dict[str, Any]:
     mw_load_by_bus = group_loads_by_bus(mw_df)
     mvar_load_by_bus = group_loads_by_bus(mvar_df) if mvar_df is not None else {}
     
-    # Apply each move operation
+    # Collect MW moves per column so each column is updated with one ufunc.at call
+    mw_moves: Dict[str, Tuple[List[int], List[int], List[float]]] = {}
+    mvar_columns: Dict[str, np.ndarray] = {}
+    num_rows = len(mw_df)
+
     for op in operations:
-        bus_id = op['bus_id']
         from_idx = op['from_index']
         to_idx = op['to_index']
-        mw_value = op['mw_value']
+        # Negative indices would silently wrap around in the array updates below
+        if not (0 <= from_idx < num_rows and 0 <= to_idx < num_rows):
+            raise ValueError(f"Load move index out of range: from {from_idx} to {to_idx} ({num_rows} timepoints)")
         
-        bus_num = int(bus_id)
+        bus_num = int(op['bus_id'])
         
         # Get MW column name
         mw_col = mw_load_by_bus.get(bus_num, {}).get('mw_col')
         if not mw_col:
             continue
         
+        from_indices, to_indices, mw_values = mw_moves.setdefault(mw_col, ([], [], []))
+        from_indices.append(from_idx)
+        to_indices.append(to_idx)
+        mw_values.append(op['mw_value'])
+        
         # Get the corresponding MVar value from the same slot
         # We move the entire active and reactive power together
         mvar_col = mvar_load_by_bus.get(bus_num, {}).get('mvar_col') if mvar_df is not None else None
         
-        # Get the original MVar value at the from_idx
+        # Move the exact MVar value that is at the from slot. This depends on earlier
+        # operations, so MVar moves are applied in order on the column array.
         if mvar_col:
-            original_mvar_from = mvar_df.loc[from_idx, mvar_col]
-            # Move the exact MVar value that was at the from slot
-            mvar_value = original_mvar_from
-        else:
-            mvar_value = 0
-            
-        # Move MW value
-        mw_df.loc[from_idx, mw_col] = mw_df.loc[from_idx, mw_col] - mw_value
-        mw_df.loc[to_idx, mw_col] = mw_df.loc[to_idx, mw_col] + mw_value
-        
-        # Move MVar value (the entire value from the slot)
-        if mvar_col:
-            mvar_df.loc[from_idx, mvar_col] = mvar_df.loc[from_idx, mvar_col] - mvar_value
-            mvar_df.loc[to_idx, mvar_col] = mvar_df.loc[to_idx, mvar_col] + mvar_value
+            if mvar_col not in mvar_columns:
+                mvar_columns[mvar_col] = mvar_df[mvar_col].to_numpy(dtype=np.float64, copy=True)
+            mvar_values = mvar_columns[mvar_col]
+            mvar_value = mvar_values[from_idx]
+            mvar_values[from_idx] -= mvar_value
+            mvar_values[to_idx] += mvar_value
+    
+    for mw_col, (from_indices, to_indices, mw_values) in mw_moves.items():
+        values = mw_df[mw_col].to_numpy(dtype=np.float64, copy=True)
+        np.subtract.at(values, from_indices, mw_values)
+        np.add.at(values, to_indices, mw_values)
+        mw_df[mw_col] = values
+    
+    for mvar_col, values in mvar_columns.items():
+        mvar_df[mvar_col] = values
     
     # Reconstruct paste strings
     def df_to_paste_string(df: pd.DataFrame) -> str:
-        lines = ["Timepoint"]
-        header = '\t'.join(df.columns)
-        lines.append(header)
-        
-        for _, row in df.iterrows():
-            line = '\t'.join(str(row[col]) for col in df.columns)
-            lines.append(line)
-        
-        return '\n'.join(lines)
+        # QUOTE_NONE keeps cells verbatim, like the tab-joined paste the user supplied
+        table = df.to_csv(
+            None, sep='\t', index=False, lineterminator='\n', quoting=csv.QUOTE_NONE
+        )
+        return "Timepoint\n" + table[:-1]
     
     mw_paste_string = df_to_paste_string(mw_df)
     mvar_paste_string = df_to_paste_string(mvar_df) if mvar_df is not None else None
@@ -568,31 +648,21 @@ def apply_load_moves(operations: List[Dict[str, Any]]) -> Dict[str, Any]:
         load_store.current_mvar = mvar_paste_string
     
     # Extract MW data for frontend
-    current_mw_data: Dict[str, List[float]] = {}
-    for bus_num, cols in mw_load_by_bus.items():
-        col = cols.get('mw_col')
-        if col:
-            current_mw_data[str(bus_num)] = mw_df[col].tolist()
+    current_mw = _load_arrays_by_bus(mw_df, mw_load_by_bus, "mw_col")
     
     # Parse original default data for comparison
-    original_mw_df = parse_loads(load_store.default_mw)
-    original_mw_load_by_bus = group_loads_by_bus(original_mw_df)
-    original_mw_data: Dict[str, List[float]] = {}
-    for bus_num, cols in original_mw_load_by_bus.items():
-        col = cols.get('mw_col')
-        if col:
-            original_mw_data[str(bus_num)] = original_mw_df[col].tolist()
+    original_mw_df, original_mw_load_by_bus = load_store.get_default_mw()
+    original_mw = _load_arrays_by_bus(original_mw_df, original_mw_load_by_bus, "mw_col")
     
     # Calculate load cost based on differences from original
-    energy_moved_kwh: Dict[str, float] = {}
-    for bus_str, current_values in current_mw_data.items():
-        if bus_str in original_mw_data:
-            original_values = original_mw_data[bus_str]
-            if len(current_values) == len(original_values):
-                differences = [current_values[i] - original_values[i] for i in range(len(current_values))]
-                # Convert MW to kWh: MW * 1 hour = MWh, then MWh * 1000 = kWh
-                # Divide by 2 because each move is counted twice (from source and to destination)
-                energy_moved_kwh[bus_str] = sum(abs(d) for d in differences) / 2.0 * 1000
+    energy_moved_kwh = _energy_moved_kwh({
+        str(bus_num): current_values - original_mw[bus_num]
+        for bus_num, current_values in current_mw.items()
+        if bus_num in original_mw and len(current_values) == len(original_mw[bus_num])
+    })
+    
+    current_mw_data = {str(bus_num): values for bus_num, values in current_mw.items()}
+    original_mw_data = {str(bus_num): values for bus_num, values in original_mw.items()}
     
     total_energy_moved = sum(energy_moved_kwh.values())
     load_cost_eur = total_energy_moved * LOAD_COST_PER_KWH_EUR
@@ -617,14 +687,11 @@ def reset_load_moves() -> Dict[str, Any]:
     load_store.current_load_cost_eur = 0.0
     
     # Parse and extract MW data
-    mw_df = parse_loads(load_store.default_mw)
-    mw_load_by_bus = group_loads_by_bus(mw_df)
+    mw_df, mw_load_by_bus = load_store.get_default_mw()
     
-    current_mw_data: Dict[str, List[float]] = {}
-    for bus_num, cols in mw_load_by_bus.items():
-        col = cols.get('mw_col')
-        if col:
-            current_mw_data[str(bus_num)] = mw_df[col].tolist()
+    current_mw_data = {
+        str(bus_num): values for bus_num, values in _load_arrays_by_bus(mw_df, mw_load_by_bus, "mw_col").items()
+    }
     
     return {
         "loads_mw_paste": load_store.default_mw,
@@ -9,6 +9,9 @@ VOLTAGE_MAX_PU = 1.1
 CAPACITY_TOLERANCE_KWH = 0.01
 ENERGY_TOLERANCE_MW = 0.01
 
+PARSE_CACHE_SIZE = 16
+MAX_REQUEST_BYTES = 10 * 1024 * 1024
+
 BATTERY_CONSTRAINTS = {
     BatteryType.HOME: BatteryConstraints(
         cost_per_kwh=1000,
@@ -1,10 +1,14 @@
 import logging
+import threading
 from datetime import datetime
 from typing import Dict, Any
 
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from models import (
     UpdateBatteryRequest,
@@ -19,9 +23,60 @@ from analysis import (
     reset_load_moves
 )
 from parsing import reconstruct_table
+from config import MAX_REQUEST_BYTES
 from report import generate_pdf_report
 
-app = FastAPI(title="PowerWorld Simulation Analyzer")
+
+class NumpyJSONResponse(ORJSONResponse):
+    # Serializes NumPy arrays and scalars directly, without converting them to Python lists first.
+    # Endpoints returning arrays must return this response themselves: FastAPI runs its
+    # jsonable_encoder on plain return values, which does not understand ndarrays.
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+app = FastAPI(title="PowerWorld Simulation Analyzer", default_response_class=NumpyJSONResponse)
+
+# Compute endpoints are plain functions so FastAPI runs them in its threadpool; the ones that
+# read or replace the module-level load state take this lock so they still apply one at a time
+load_state_lock = threading.Lock()
+
+
+class RequestSizeLimitMiddleware:
+    # Rejects oversized pastes before they are parsed. Content-Length is checked up front and the
+    # streamed body is counted too, so chunked uploads without a length can't bypass the limit.
+    def __init__(self, app: ASGIApp, max_bytes: int) -> None:
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_bytes:
+            response = NumpyJSONResponse(status_code=413, content={"detail": "Request body too large"})
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def receive_limited() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    raise HTTPException(status_code=413, detail="Request body too large")
+            return message
+
+        await self.app(scope, receive_limited, send)
+
+
+# Registered before CORS so CORS wraps it and its 413 responses carry the CORS headers too
+app.add_middleware(RequestSizeLimitMiddleware, max_bytes=MAX_REQUEST_BYTES)
+
 
 # CORS - allow all origins (API is proxied through Next.js in production)
 app.add_middleware(
@@ -32,6 +87,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
 @app.get("/")
 async def read_root():
     return {"message": "PowerWorld Simulation Analyzer API", "status": "running"}
@@ -43,22 +99,24 @@ async def health():
 
 
 @app.post("/api/analyze")
-async def analyze(request: AnalyzeRequest):
-    return analyze_all(
-        request.lines_data,
-        request.generators_data,
-        request.buses_data,
-        request.loads_mw_data,
-        request.loads_mvar_data
-    )
+def analyze(request: AnalyzeRequest):
+    with load_state_lock:
+        result = analyze_all(
+            request.lines_data,
+            request.generators_data,
+            request.buses_data,
+            request.loads_mw_data,
+            request.loads_mvar_data
+        )
+    return NumpyJSONResponse(result)
 
 
 @app.post("/api/analyze/generators/update-battery")
-async def update_battery_endpoint(request: UpdateBatteryRequest):
+def update_battery_endpoint(request: UpdateBatteryRequest):
     try:
         if not request.battery_table_data:
             raise HTTPException(status_code=400, detail="No battery table data provided")
-        return update_battery_capacity(request.battery_table_data, request.datetime)
+        return NumpyJSONResponse(update_battery_capacity(request.battery_table_data, request.datetime))
     except HTTPException:
         raise
     except Exception as e:
@@ -67,41 +125,43 @@ async def update_battery_endpoint(request: UpdateBatteryRequest):
 
 
 @app.post("/api/analyze/generators/reconstruct")
-async def reconstruct_table_endpoint(request: ReconstructTableRequest):
+def reconstruct_table_endpoint(request: ReconstructTableRequest):
     try:
         data = reconstruct_table(
             request.battery_table_data,
             request.original_data,
             request.original_columns
         )
-        return {"data": data}
+        return NumpyJSONResponse({"data": data})
     except Exception as e:
         logging.error(f"Error reconstructing table: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error reconstructing table: {str(e)}")
 
 
 @app.post("/api/loads/move")
-async def move_loads_endpoint(request: MoveLoadsRequest):
+def move_loads_endpoint(request: MoveLoadsRequest):
     try:
-        result = apply_load_moves([op.dict() for op in request.operations])
-        return result
+        with load_state_lock:
+            result = apply_load_moves([op.dict() for op in request.operations])
+        return NumpyJSONResponse(result)
     except Exception as e:
         logging.error(f"Error applying load moves: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error applying load moves: {str(e)}")
 
 
 @app.post("/api/loads/reset")
-async def reset_loads_endpoint():
+def reset_loads_endpoint():
     try:
-        result = reset_load_moves()
-        return result
+        with load_state_lock:
+            result = reset_load_moves()
+        return NumpyJSONResponse(result)
     except Exception as e:
         logging.error(f"Error resetting load moves: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error resetting load moves: {str(e)}")
 
 
 @app.post("/api/generate-report")
-async def generate_report(request: Dict[str, Any]):
+def generate_report(request: Dict[str, Any]):
     try:
         buffer = generate_pdf_report(request)
         return StreamingResponse(
@@ -1,6 +1,6 @@
 from enum import Enum
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class BusType(str, Enum):
@@ -63,8 +63,8 @@ class AnalyzeRequest(BaseModel):
 
 class LoadMoveOperation(BaseModel):
     bus_id: str
-    from_index: int
-    to_index: int
+    from_index: int = Field(..., ge=0)
+    to_index: int = Field(..., ge=0)
     mw_value: float
 
 
@@ -1,8 +1,17 @@
+import csv
 import io
 import re
+from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 import pandas as pd
 
+_BRANCH_RE = re.compile(r'(\d+)\s+\([^)]+\)\s+TO\s+(\d+)\s+\([^)]+\)')
+_BRANCH_SIMPLE_RE = re.compile(r'(\d+)\s+TO\s+(\d+)')
+_GEN_BUS_RE = re.compile(r'gen\s*(\d+)', re.IGNORECASE)
+_EV_LOAD_RE = re.compile(r'Bus\s+(\d+)\s+#EV\s+(MW|Mvar)', re.IGNORECASE)
+PU_VOLT_RE = re.compile(r'(\d+)\s+PU Volt')
+
 
 def parse_datetime(date_str: str, time_str: str) -> str:
     date_parts = date_str.split('/')
@@ -37,49 +46,94 @@ def parse_datetime(date_str: str, time_str: str) -> str:
     return f"{year}-{month.zfill(2)}-{day.zfill(2)}T{str(hours).zfill(2)}:{str(minutes).zfill(2)}:{str(seconds).zfill(2)}"
 
 
-def find_header_row(lines: List[str], start_index: int = 0) -> int:
-    for i in range(start_index, len(lines)):
-        line_lower = lines[i].lower()
-        if 'date' in line_lower and 'time' in line_lower and '\t' in lines[i]:
-            return i
+def find_header_offset(text: str) -> int:
+    # Character offset of the first line holding the Date/Time header; the header sits
+    # near the top, so walk line boundaries instead of splitting the whole paste
+    start = 0
+    while start <= len(text):
+        end = text.find('\n', start)
+        if end == -1:
+            end = len(text)
+        line = text[start:end]
+        if '\t' in line:
+            line_lower = line.lower()
+            if 'date' in line_lower and 'time' in line_lower:
+                return start
+        start = end + 1
     return -1
 
 
 def parse_tsv_with_header(text: str) -> pd.DataFrame:
-    all_lines = text.split('\n')
-    header_index = find_header_row(all_lines)
+    header_offset = find_header_offset(text)
 
-    if header_index == -1:
+    if header_offset == -1:
         raise ValueError('Could not find header row with Date and Time columns')
 
-    data_lines = '\n'.join(all_lines[header_index:])
-    df = pd.read_csv(io.StringIO(data_lines), sep='\t', dtype=str)
+    df = pd.read_csv(io.StringIO(text[header_offset:]), sep='\t', dtype=str)
 
     if 'Timepoint' in df.columns:
         df = df.drop(columns=['Timepoint'])
 
-    df = df[df['Date'].notna() & df['Time'].notna()]
-    df = df[~df['Date'].str.lower().isin(['date', 'timepoint'])]
-    df = df[df['Date'].str.strip() != '']
+    # Drop blank rows and repeated header rows in a single pass
+    date = df['Date']
+    mask = date.notna() & df['Time'].notna()
+    mask &= ~date.str.lower().isin(['date', 'timepoint'])
+    mask &= date.str.strip().ne('')
+
+    return df.loc[mask].reset_index(drop=True)
 
-    return df.reset_index(drop=True)
+
+def _to_numeric(values: pd.Series) -> pd.Series:
+    # Replace comma decimal separators with periods (European format support)
+    return pd.to_numeric(values.astype(str).str.replace(',', '.', regex=False), errors='coerce')
 
 
 def convert_numeric_columns(df: pd.DataFrame, exclude: List[str]) -> pd.DataFrame:
-    for col in df.columns:
-        if col not in exclude:
-            # Replace comma decimal separators with periods (European format support)
-            df[col] = df[col].astype(str).str.replace(',', '.', regex=False)
-            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0.0)
+    numeric_cols = [col for col in df.columns if col not in exclude]
+    if numeric_cols:
+        # Convert column by column: DataFrame.apply on a zero-row frame leaves object dtype
+        converted = {col: _to_numeric(df[col]).fillna(0.0) for col in numeric_cols}
+        df[numeric_cols] = pd.DataFrame(converted, index=df.index)
     return df
 
 
+def _extract_datetimes_vectorized(df: pd.DataFrame) -> List[str]:
+    # Column-wise equivalent of parse_datetime; raises on anything irregular
+    date_parts = df['Date'].astype(str).str.split('/', expand=True)
+    if date_parts.shape[1] != 3:
+        raise ValueError("Irregular date values")
+    first, second, year = date_parts[0], date_parts[1], date_parts[2]
+    second.astype(int)  # parse_datetime rejects non-numeric day/month parts too
+    day_first = first.astype(int) > 12
+    month = second.where(day_first, first)
+    day = first.where(day_first, second)
+
+    time_parts = df['Time'].astype(str).str.split(' ', expand=True)
+    clock = time_parts[0].str.split(':', expand=True)
+    hours = clock[0].astype(int)
+    minutes = clock[1].astype(int) if clock.shape[1] > 1 else 0
+    seconds = clock[2].astype(int) if clock.shape[1] > 2 else 0
+    if time_parts.shape[1] > 1:
+        ampm = time_parts[1].str.upper()
+        hours = hours.mask((ampm == 'PM') & (hours != 12), hours + 12)
+        hours = hours.mask((ampm == 'AM') & (hours == 12), 0)
+
+    times = pd.DataFrame({'h': hours, 'm': minutes, 's': seconds}, index=df.index).astype(str)
+    datetimes = (
+        year + '-' + month.str.zfill(2) + '-' + day.str.zfill(2)
+        + 'T' + times['h'].str.zfill(2) + ':' + times['m'].str.zfill(2) + ':' + times['s'].str.zfill(2)
+    )
+    return datetimes.tolist()
+
+
 def extract_datetimes(df: pd.DataFrame) -> List[str]:
-    datetimes = []
-    for idx, row in df.iterrows():
-        dt = parse_datetime(str(row['Date']), str(row['Time']))
-        datetimes.append(dt)
-    return datetimes
+    if df.empty:
+        return []
+    try:
+        return _extract_datetimes_vectorized(df)
+    except (ValueError, TypeError):
+        # Mixed or malformed rows: parse one by one so errors point at the offending value
+        return [parse_datetime(str(date), str(time)) for date, time in zip(df['Date'].to_numpy(), df['Time'].to_numpy())]
 
 
 def parse_generators(text: str) -> pd.DataFrame:
@@ -94,15 +148,20 @@ def parse_loads(text: str) -> pd.DataFrame:
 
 def parse_lines(text: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
     df = parse_tsv_with_header(text)
-    df = convert_numeric_columns(df, exclude=['Date', 'Time'])
     base_cols = ['Date', 'Time', 'Skip']
+    columns = df.columns
+    lower_cols = columns.str.lower()
     # Match columns with "% of MVA Limit" (with or without "From")
-    mva_limit_cols = base_cols + [col for col in df.columns if '% of mva limit' in col.lower() and col not in base_cols]
+    mva_limit_mask = lower_cols.str.contains('% of mva limit', regex=False) & ~columns.isin(base_cols)
     # Match columns with "MW From" but NOT "% of MVA"
-    mw_from_cols = base_cols + [col for col in df.columns if 'mw from' in col.lower() and '% of mva' not in col.lower()]
-
-    mva_limit_df = df[[c for c in mva_limit_cols if c in df.columns]].copy()
-    mw_from_df = df[[c for c in mw_from_cols if c in df.columns]].copy()
+    mw_from_mask = lower_cols.str.contains('mw from', regex=False) & ~lower_cols.str.contains('% of mva', regex=False)
+    present_base_cols = [c for c in base_cols if c in columns]
+
+    # Only the selected columns are converted; anything else in the paste is dropped anyway
+    mva_limit_df = df[present_base_cols + columns[mva_limit_mask].tolist()].copy()
+    mw_from_df = df[present_base_cols + columns[mw_from_mask].tolist()].copy()
+    mva_limit_df = convert_numeric_columns(mva_limit_df, exclude=['Date', 'Time'])
+    mw_from_df = convert_numeric_columns(mw_from_df, exclude=['Date', 'Time'])
     return mva_limit_df, mw_from_df
 
 
@@ -111,26 +170,31 @@ def parse_buses(text: str) -> pd.DataFrame:
     return convert_numeric_columns(df, exclude=['Date', 'Time'])
 
 
+@lru_cache(maxsize=512)
 def extract_branch_name(column: str) -> str:
-    match = re.search(r'(\d+)\s+\([^)]+\)\s+TO\s+(\d+)\s+\([^)]+\)', column)
+    match = _BRANCH_RE.search(column)
     if match:
         return f"{match.group(1)}-{match.group(2)}"
-    match = re.search(r'(\d+)\s+TO\s+(\d+)', column)
+    match = _BRANCH_SIMPLE_RE.search(column)
     if match:
         return f"{match.group(1)}-{match.group(2)}"
     return column
 
 
 def group_battery_columns_by_bus(battery_cols: List[str]) -> Dict[int, List[str]]:
-    battery_by_bus: Dict[int, List[str]] = {}
+    # The battery column set rarely changes between requests; the grouping is cached as
+    # tuples and copied into fresh lists so callers can't corrupt the cache
+    return {bus: list(cols) for bus, cols in _group_battery_columns_by_bus(tuple(battery_cols))}
+
+
+@lru_cache(maxsize=128)
+def _group_battery_columns_by_bus(battery_cols: Tuple[str, ...]) -> Tuple[Tuple[int, Tuple[str, ...]], ...]:
+    battery_by_bus: Dict[int, List[str]] = defaultdict(list)
     for col in battery_cols:
-        match = re.search(r'gen\s*(\d+)', col, re.IGNORECASE)
+        match = _GEN_BUS_RE.search(col)
         if match:
-            bus_num = int(match.group(1))
-            if bus_num not in battery_by_bus:
-                battery_by_bus[bus_num] = []
-            battery_by_bus[bus_num].append(col)
-    return battery_by_bus
+            battery_by_bus[int(match.group(1))].append(col)
+    return tuple((bus, tuple(cols)) for bus, cols in battery_by_bus.items())
 
 
 def group_loads_by_bus(df: pd.DataFrame) -> Dict[int, Dict[str, Optional[str]]]:
@@ -140,7 +204,7 @@ def group_loads_by_bus(df: pd.DataFrame) -> Dict[int, Dict[str, Optional[str]]]:
         if col in ['Date', 'Time']:
             continue
 
-        match = re.match(r'Bus\s+(\d+)\s+#EV\s+(MW|Mvar)', col, re.IGNORECASE)
+        match = _EV_LOAD_RE.match(col)
         if match:
             bus_num = int(match.group(1))
             load_type = match.group(2).lower()
@@ -162,18 +226,27 @@ def reconstruct_table(battery_data: List[Dict], original_data: List[Dict], origi
 
     battery_cols = [col for col in battery_df.columns if col not in ['Date', 'Time']]
 
-    for col in battery_cols:
-        if col in original_df.columns:
-            battery_map = battery_df.set_index(['Date', 'Time'])[col].to_dict()
-            original_df[col] = original_df.apply(
-                lambda row: battery_map.get((str(row['Date']), str(row['Time'])), row[col]),
-                axis=1
-            )
-
-    output_lines = ['Timepoint']
-    output_lines.append('\t'.join(original_df.columns.tolist()))
-
-    for _, row in original_df.iterrows():
-        output_lines.append('\t'.join([str(val) if pd.notna(val) else '' for val in row.values]))
-
-    return '\n'.join(output_lines)
+    common_cols = [col for col in battery_cols if col in original_df.columns]
+    if common_cols:
+        # Align battery rows onto the original rows by (Date, Time); later duplicates win
+        battery_keys = pd.MultiIndex.from_arrays([battery_df['Date'], battery_df['Time']])
+        battery_values = battery_df[common_cols].set_axis(battery_keys)
+        battery_values = battery_values[~battery_keys.duplicated(keep='last')]
+
+        original_keys = pd.MultiIndex.from_arrays(
+            [original_df['Date'].astype(str), original_df['Time'].astype(str)]
+        )
+        found = original_keys.isin(battery_values.index)
+        aligned = battery_values.reindex(original_keys).set_axis(original_df.index)
+        for col in common_cols:
+            original_df[col] = aligned[col].where(found, original_df[col])
+
+    lines = ['Timepoint', '\t'.join(original_df.columns.tolist())]
+    # QUOTE_NONE keeps cells containing quotes verbatim, matching the raw header line
+    rows = original_df.to_csv(
+        None, sep='\t', index=False, header=False, na_rep='', lineterminator='\n',
+        quoting=csv.QUOTE_NONE
+    )
+    if rows:
+        lines.append(rows[:-1])
+    return '\n'.join(lines)
@@ -0,0 +1,33 @@
+from fastapi.testclient import TestClient
+
+from main import app
+from parsing import parse_buses, parse_generators, reconstruct_table
+
+GENERATORS_HEADER = "Date\tTime\tGen 1 #1 MW\tGen 5 #1 MW\n"
+BUSES_HEADER = "Date\tTime\t1 PU Volt\t5 PU Volt\n"
+
+
+def test_header_only_paste_has_numeric_columns():
+    for df in (parse_generators(GENERATORS_HEADER), parse_buses(BUSES_HEADER)):
+        assert df.empty
+        for col in df.columns[2:]:
+            assert df[col].dtype != object
+
+
+def test_analyze_header_only_paste():
+    client = TestClient(app)
+    response = client.post("/api/analyze", json={
+        "generators_data": GENERATORS_HEADER,
+        "buses_data": BUSES_HEADER,
+    })
+    assert response.status_code == 200
+
+
+def test_reconstruct_table_writes_cells_verbatim():
+    original = [{"Date": "1/1/2024", "Time": "00:00", "Quoted": 'a"b', "Path": "c\\d"}]
+    table = reconstruct_table([], original, [])
+    assert table == 'Timepoint\nDate\tTime\tQuoted\tPath\n1/1/2024\t00:00\ta"b\tc\\d'
+
+
+def test_reconstruct_table_empty():
+    assert reconstruct_table([], [], []) == "Timepoint\n"
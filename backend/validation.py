@@ -1,10 +1,11 @@
 import math
-import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
+import numpy as np
 import pandas as pd
 
 from models import ValidationErrorType, BatteryConstraints, BatteryType
 from config import VOLTAGE_MIN_PU, VOLTAGE_MAX_PU, CAPACITY_TOLERANCE_KWH, ENERGY_TOLERANCE_MW
+from parsing import PU_VOLT_RE
 
 
 def round_capacity(capacity: float, rounding_increment: int) -> float:
@@ -12,33 +13,40 @@ def round_capacity(capacity: float, rounding_increment: int) -> float:
     return math.ceil(capacity_rounded / rounding_increment) * rounding_increment
 
 
-def calculate_capacity_timeseries(bus_mw: pd.Series) -> pd.Series:
-    capacity_values = [0.0]
-    for mw in bus_mw:
-        capacity_values.append(capacity_values[-1] - mw)
-    return pd.Series(capacity_values) * 1000
+def calculate_capacity_timeseries(bus_mw: np.ndarray) -> np.ndarray:
+    # Capacity starts empty and each timestep's MW output drains it (charging is negative MW).
+    # Accepts one bus's series or a (timesteps x buses) matrix; Fortran order keeps each
+    # bus's capacity column contiguous
+    mw = np.asarray(bus_mw, dtype=np.float64)
+    capacity_kwh = np.empty((mw.shape[0] + 1,) + mw.shape[1:], dtype=np.float64, order='F')
+    capacity_kwh[0] = 0.0
+    np.cumsum(-mw, axis=0, out=capacity_kwh[1:])
+    capacity_kwh *= 1000.0
+    return capacity_kwh
 
 
 def validate_battery_capacity(
     bus_num: int,
-    capacity_kwh: pd.Series,
-    mw_values: pd.Series,
+    capacity_kwh: np.ndarray,
+    mw_values: np.ndarray,
     constraints: BatteryConstraints
 ) -> List[Dict[str, Any]]:
     errors = []
-    max_capacity = max(capacity_kwh) if len(capacity_kwh) > 0 else 0.0
+    capacity = np.asarray(capacity_kwh, dtype=np.float64)
+    mw = np.asarray(mw_values, dtype=np.float64)
+    max_capacity = capacity.max() if capacity.size > 0 else 0.0
 
-    for timestep, capacity in enumerate(capacity_kwh):
-        if capacity < -CAPACITY_TOLERANCE_KWH:
-            errors.append({
-                "bus": str(bus_num),
-                "timestep": timestep,
-                "capacity": float(capacity),
-                "error_type": ValidationErrorType.NEGATIVE_CAPACITY.value
-            })
+    # Only timesteps that violate a limit are visited in Python
+    for timestep in np.flatnonzero(capacity < -CAPACITY_TOLERANCE_KWH):
+        errors.append({
+            "bus": str(bus_num),
+            "timestep": int(timestep),
+            "capacity": float(capacity[timestep]),
+            "error_type": ValidationErrorType.NEGATIVE_CAPACITY.value
+        })
 
     if max_capacity > constraints.max_size_kwh:
-        max_timestep = capacity_kwh.idxmax() if len(capacity_kwh) > 0 else 0
+        max_timestep = capacity.argmax() if capacity.size > 0 else 0
         errors.append({
             "bus": str(bus_num),
             "timestep": int(max_timestep),
@@ -52,25 +60,25 @@ def validate_battery_capacity(
     rounded_capacity = round_capacity(max_capacity, constraints.rounding_increment_kwh)
     max_power_rating_mw = rounded_capacity / 1000
 
-    for timestep, mw in enumerate(mw_values):
-        if abs(mw) > max_power_rating_mw:
-            errors.append({
-                "bus": str(bus_num),
-                "timestep": timestep + 1,
-                "capacity": float(capacity_kwh.iloc[timestep + 1] if timestep + 1 < len(capacity_kwh) else 0),
-                "power": float(mw),
-                "max_power_rating": float(max_power_rating_mw),
-                "installed_capacity": float(rounded_capacity),
-                "error_type": ValidationErrorType.EXCEEDS_POWER_RATING.value,
-                "message": f"Bus {bus_num} power {abs(mw):.3f} MW exceeds 1C rate limit of {max_power_rating_mw:.3f} MW (battery: {rounded_capacity:.0f} kWh)"
-            })
+    for timestep in np.flatnonzero(np.abs(mw) > max_power_rating_mw):
+        power = float(mw[timestep])
+        errors.append({
+            "bus": str(bus_num),
+            "timestep": int(timestep) + 1,
+            "capacity": float(capacity[timestep + 1] if timestep + 1 < capacity.size else 0),
+            "power": power,
+            "max_power_rating": float(max_power_rating_mw),
+            "installed_capacity": float(rounded_capacity),
+            "error_type": ValidationErrorType.EXCEEDS_POWER_RATING.value,
+            "message": f"Bus {bus_num} power {abs(power):.3f} MW exceeds 1C rate limit of {max_power_rating_mw:.3f} MW (battery: {rounded_capacity:.0f} kWh)"
+        })
 
     return errors
 
 
 def check_battery_warnings(
     bus_num: int,
-    capacity_kwh: pd.Series,
+    capacity_kwh: np.ndarray,
     constraints: Optional[BatteryConstraints]
 ) -> List[Dict[str, Any]]:
     warnings = []
@@ -78,8 +86,9 @@ def check_battery_warnings(
     if len(capacity_kwh) == 0:
         return warnings
 
-    max_capacity = max(capacity_kwh)
-    final_capacity = capacity_kwh.iloc[-1]
+    capacity = np.asarray(capacity_kwh, dtype=np.float64)
+    max_capacity = capacity.max()
+    final_capacity = capacity[-1]
 
     if final_capacity > 0.1:
         warnings.append({
@@ -112,35 +121,47 @@ def check_battery_warnings(
     return warnings
 
 
-def validate_bus_voltages(df: pd.DataFrame) -> List[Dict[str, Any]]:
+def validate_bus_voltages(df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], Set[str]]:
     errors = []
-    voltage_cols = [col for col in df.columns if 'PU Volt' in col]
+    violating_buses = set()
+    voltage_cols = []
+    bus_nums = []
 
-    for col in voltage_cols:
-        bus_match = re.match(r'(\d+)\s+PU Volt', col)
-        if not bus_match:
+    for col in df.columns:
+        if 'PU Volt' not in col:
             continue
+        bus_match = PU_VOLT_RE.match(col)
+        if bus_match:
+            voltage_cols.append(col)
+            bus_nums.append(bus_match.group(1))
+
+    if not voltage_cols:
+        return errors, violating_buses
+
+    voltages = df[voltage_cols].to_numpy(dtype=np.float64)
+    # NaN fails both comparisons, so missing readings are never violations
+    out_of_range = (voltages < VOLTAGE_MIN_PU) | (voltages > VOLTAGE_MAX_PU)
+
+    # Transposed so errors stay grouped by bus, then ordered by timestep
+    for col_index, idx in zip(*np.nonzero(out_of_range.T)):
+        bus_num = bus_nums[col_index]
+        voltage = float(voltages[idx, col_index])
+        violating_buses.add(bus_num)
+        errors.append({
+            "bus": bus_num,
+            "timestep": int(idx),
+            "voltage": voltage,
+            "error_type": ValidationErrorType.VOLTAGE_VIOLATION.value,
+            "message": f"Bus {bus_num} - Timestep {idx}: Voltage = {voltage:.3f} p.u. (must be between {VOLTAGE_MIN_PU} and {VOLTAGE_MAX_PU})"
+        })
 
-        bus_num = bus_match.group(1)
-
-        for idx, voltage in enumerate(df[col]):
-            if pd.notna(voltage):
-                if voltage < VOLTAGE_MIN_PU or voltage > VOLTAGE_MAX_PU:
-                    errors.append({
-                        "bus": bus_num,
-                        "timestep": idx,
-                        "voltage": float(voltage),
-                        "error_type": ValidationErrorType.VOLTAGE_VIOLATION.value,
-                        "message": f"Bus {bus_num} - Timestep {idx}: Voltage = {voltage:.3f} p.u. (must be between {VOLTAGE_MIN_PU} and {VOLTAGE_MAX_PU})"
-                    })
-
-    return errors
+    return errors, violating_buses
 
 
 def validate_load_energy_conservation(
     bus_num: int,
-    new_values: List[float],
-    default_values: List[float],
+    new_values: np.ndarray,
+    default_values: np.ndarray,
     load_type: str
 ) -> List[Dict[str, Any]]:
     errors = []
@@ -153,8 +174,8 @@ def validate_load_energy_conservation(
         })
         return errors
 
-    total_default = sum(default_values)
-    total_new = sum(new_values)
+    total_default = float(np.sum(default_values))
+    total_new = float(np.sum(new_values))
 
     if abs(total_new - total_default) > ENERGY_TOLERANCE_MW:
         unit = "MW" if load_type == "mw" else "MVar"
@@ -196,20 +217,16 @@ def validate_load_pq_sync(
     return errors
 
 
-def detect_reverse_power_flow(values: List[float], branch_name: str) -> Optional[Dict[str, Any]]:
+def detect_reverse_power_flow(values: np.ndarray, branch_name: str) -> Optional[Dict[str, Any]]:
     if branch_name != "1-2":
         return None
 
-    min_mw = None
-    has_reverse = False
-
-    for value in values:
-        if pd.notna(value) and value < 0:
-            has_reverse = True
-            if min_mw is None or value < min_mw:
-                min_mw = value
+    # NaN compares False, so missing values never count as reverse flow
+    reverse = np.asarray(values, dtype=np.float64)
+    reverse = reverse[reverse < 0]
 
-    if has_reverse:
+    if reverse.size:
+        min_mw = reverse.min()
         return {
             "branch": branch_name,
             "min_mw": float(min_mw),
@@ -147,7 +147,6 @@ export function useAnalysisData() {
       if (!prev.generators) return prev
       const updatedGenerators = new GeneratorsData(
         prev.generators.columns,
-        prev.generators.rows,
         prev.generators.data,
         prev.generators.datetime,
         prev.generators.generators,
@@ -182,7 +181,6 @@ export function useAnalysisData() {
           if (!prev.generators) return prev
           const updatedGenerators = new GeneratorsData(
             prev.generators.columns,
-            prev.generators.rows,
             prev.generators.data,
             prev.generators.datetime,
             prev.generators.generators,
@@ -240,7 +238,6 @@ export function useAnalysisData() {
         
         const updatedLoads = new LoadsData(
           prev.loads.columns,
-          prev.loads.rows,
           prev.loads.data,
           prev.loads.datetime,
           prev.loads.load_columns,
@@ -313,7 +310,6 @@ export function useAnalysisData() {
         
         const updatedLoads = new LoadsData(
           prev.loads.columns,
-          prev.loads.rows,
           prev.loads.data,
           prev.loads.datetime,
           prev.loads.load_columns,
@@ -282,7 +282,6 @@ export class BusesData {
 export class GeneratorsData {
   constructor(
     public columns: string[],
-    public rows: any[][],
     public data: Record<string, any>[],
     public datetime: string[],
     public generators: Record<string, any[]>,
@@ -297,7 +296,6 @@ export class GeneratorsData {
   static fromJSON(json: any): GeneratorsData {
     return new GeneratorsData(
       json.columns,
-      json.rows,
       json.data,
       json.datetime,
       json.generators,
@@ -316,7 +314,6 @@ export class GeneratorsData {
 export class LoadsData {
   constructor(
     public columns: string[],
-    public rows: any[][],
     public data: Record<string, any>[],
     public datetime: string[],
     public load_columns: string[],
@@ -334,7 +331,6 @@ export class LoadsData {
   static fromJSON(json: any): LoadsData {
     return new LoadsData(
       json.columns,
-      json.rows,
       json.data,
       json.datetime,
       json.load_columns || [],